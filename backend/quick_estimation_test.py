@@ -22,4 +22,5 @@ async def quick_test():
         print(f"❌ Error: {e}")
 
 if __name__ == "__main__":
+    import _bootstrap  # installs uvloop when available  # noqa: F401
     asyncio.run(quick_test())
@@ -7,6 +7,7 @@ import re
 import json
 import time
 import random
+import asyncio
 import logging
 import traceback
 from typing import Dict, Any, List, Optional, Tuple
@@ -16,6 +17,30 @@ import requests
 from fastapi import HTTPException
 import google.generativeai as genai
 
+# Precompiled address patterns - compiling once at import avoids the re cache
+# lookup on every call in the estimation hot path
+_UNIT_RE = re.compile(r'(?:unit|apt|#)\s*(\d+)')
+_ZIP_RE = re.compile(r'\b(\d{5})\b')
+
+# Recorded responses for the canonical test addresses, used when
+# PROPPULSE_OFFLINE=1 so test runs don't depend on live APIs
+_OFFLINE_FIXTURE_PATH = os.path.join(
+    os.path.dirname(os.path.dirname(os.path.abspath(__file__))),
+    "tests", "fixtures", "addresses.json"
+)
+_offline_fixture = None
+
+def _load_offline_fixture() -> Dict[str, Any]:
+    global _offline_fixture
+    if _offline_fixture is None:
+        try:
+            with open(_OFFLINE_FIXTURE_PATH) as f:
+                _offline_fixture = json.load(f)
+        except (OSError, json.JSONDecodeError) as e:
+            logging.getLogger(__name__).warning(f"Could not load offline fixture: {e}")
+            _offline_fixture = {}
+    return _offline_fixture
+
 class ExternalAPIService:
     """
     Service for interacting with external property data APIs
@@ -41,14 +66,56 @@ class ExternalAPIService:
         
         # Track API usage to avoid hitting limits
         self.api_call_counters = {}
-        
+
+        # In-flight lookups keyed by normalized address (singleflight):
+        # concurrent callers for the same address await one upstream fetch
+        self._inflight: Dict[str, asyncio.Future] = {}
+
     async def get_property_data(self, address: str) -> Dict[str, Any]:
         """
         Get property data prioritizing ATTOM API for real data
         Returns only verified property data, not estimates
+
+        Concurrent calls for the same address are coalesced into a single
+        upstream fetch (singleflight) so parallel test runs don't trigger
+        duplicate ATTOM/Gemini chains.
         """
+        # Offline mode: serve recorded fixture data so tests run without
+        # network access or API quota
+        if os.getenv("PROPPULSE_OFFLINE"):
+            fixture_data = _load_offline_fixture().get(address)
+            if fixture_data:
+                self.logger.info(f"PROPPULSE_OFFLINE set - serving fixture data for: {address}")
+                return fixture_data
+
+        key = address.strip().lower()
+        inflight = self._inflight.get(key)
+        if inflight is not None:
+            self.logger.info(f"Coalescing duplicate in-flight request for: {address}")
+            return await asyncio.shield(inflight)
+
+        future = asyncio.get_running_loop().create_future()
+        self._inflight[key] = future
+        try:
+            result = await self._fetch_property_data(address)
+            future.set_result(result)
+            return result
+        except Exception as e:
+            future.set_exception(e)
+            future.exception()  # mark retrieved in case nobody is waiting
+            raise
+        finally:
+            # If the leader was cancelled (client disconnect) the future is
+            # still pending - cancel it so shielded waiters wake up instead
+            # of hanging on a future nobody will ever resolve
+            if not future.done():
+                future.cancel()
+            del self._inflight[key]
+
+    async def _fetch_property_data(self, address: str) -> Dict[str, Any]:
+        """Single upstream fetch behind the singleflight gate above"""
         self.logger.info(f"Fetching REAL property data for: {address}")
-        
+
         try:
             # Use the enhanced free property data service with ATTOM integration
             from services.free_property_apis import FreePropertyDataService
@@ -238,9 +305,8 @@ class ExternalAPIService:
         Never return "Not available" - always provide intelligent estimates
         """
         try:
-            import re
             from datetime import datetime
-            
+
             # Parse address for intelligent estimation
             address_lower = address.lower()
             
@@ -263,7 +329,7 @@ class ExternalAPIService:
                 unit_sqft = 2000
             
             # Extract unit numbers for better estimation
-            unit_match = re.search(r'(?:unit|apt|#)\s*(\d+)', address_lower)
+            unit_match = _UNIT_RE.search(address_lower)
             if unit_match and property_type == "Multifamily":
                 unit_num = int(unit_match.group(1))
                 estimated_units = min(max(unit_num + 10, 20), 120)
@@ -375,7 +441,6 @@ class ExternalAPIService:
     
     def _extract_city(self, address: str) -> str:
         """Extract city from address"""
-        import re
         # Look for common city patterns
         cities = ['los angeles', 'beverly hills', 'santa monica', 'west hollywood', 'venice', 'manhattan beach']
         address_lower = address.lower()
@@ -392,8 +457,7 @@ class ExternalAPIService:
     
     def _extract_zip(self, address: str) -> str:
         """Extract ZIP code from address"""
-        import re
-        zip_match = re.search(r'\b(\d{5})\b', address)
+        zip_match = _ZIP_RE.search(address)
         return zip_match.group(1) if zip_match else "90210"
     
     def _estimate_building_style(self, property_type: str) -> str:
@@ -6,21 +6,124 @@ import asyncio
 import json
 import os
 import re
+from contextlib import asynccontextmanager
 from typing import Dict, Any, Optional
 import logging
 
 logger = logging.getLogger(__name__)
 
+class _AttomMissCache:
+    """
+    Negative-result cache for addresses ATTOM doesn't know about.
+    Repeat lookups of a known miss skip the HTTP round-trip entirely.
+    Uses a Redis Bloom filter when REDIS_URL is configured (shared across
+    processes, O(1) memory per address), otherwise a plain in-process set.
+    """
+
+    _BLOOM_KEY = "attom:misses"
+
+    def __init__(self):
+        self._local_misses = set()
+        self._redis = None
+        self._redis_checked = False
+
+    def _get_redis(self):
+        """Connect and create the filter on first use (blocking - run in a thread).
+
+        Deferred from __init__ so importing this module never does a
+        network round-trip.
+        """
+        if not self._redis_checked:
+            self._redis_checked = True
+            redis_url = os.getenv("REDIS_URL")
+            if redis_url:
+                try:
+                    import redis
+                    client = redis.Redis.from_url(redis_url)
+                    # Create the filter if it doesn't exist yet (1% false positives)
+                    try:
+                        client.bf().create(self._BLOOM_KEY, 0.01, 100000)
+                    except redis.ResponseError:
+                        pass  # Filter already exists
+                    self._redis = client
+                except Exception as e:
+                    logger.warning(f"Redis bloom filter unavailable, using in-process miss cache: {e}")
+        return self._redis
+
+    async def is_known_miss(self, address: str) -> bool:
+        key = address.strip().lower()
+        if key in self._local_misses:
+            return True
+        # The sync redis client would stall the event loop on every lookup;
+        # hop to a worker thread for the round-trip instead
+        client = await asyncio.to_thread(self._get_redis)
+        if client:
+            try:
+                return bool(await asyncio.to_thread(client.bf().exists, self._BLOOM_KEY, key))
+            except Exception as e:
+                logger.warning(f"Bloom filter check failed: {e}")
+        return False
+
+    async def record_miss(self, address: str) -> None:
+        key = address.strip().lower()
+        self._local_misses.add(key)
+        client = await asyncio.to_thread(self._get_redis)
+        if client:
+            try:
+                await asyncio.to_thread(client.bf().add, self._BLOOM_KEY, key)
+            except Exception as e:
+                logger.warning(f"Bloom filter add failed: {e}")
+
+_attom_miss_cache = _AttomMissCache()
+
 class FreePropertyDataService:
     """
     Service to fetch real property data from FREE APIs
     """
     
-    def __init__(self):
+    def __init__(self, http_client: Optional[httpx.AsyncClient] = None):
         self.session = None
+        # Optional shared AsyncClient - callers fanning out many addresses
+        # can inject one pooled client so every upstream call reuses its
+        # connections instead of opening a client per request
+        self._http_client = http_client
         # Add ATTOM API Key from environment variable
         self.attom_api_key = os.getenv("ATTOM_API_KEY", "")
-    
+
+    async def warmup(self) -> None:
+        """Prime TCP+TLS connections to the upstream data hosts.
+
+        Only meaningful with an injected shared client: the concurrent HEAD
+        preflights leave warm keep-alive sockets in its pool, so the first
+        real address doesn't pay the handshakes.
+        """
+        if self._http_client is None:
+            return
+
+        hosts = [
+            "https://api.gateway.attomdata.com",
+            "https://geocoding.geo.census.gov",
+            "https://nominatim.openstreetmap.org",
+            "https://www.huduser.gov",
+        ]
+
+        async def _ping(url: str) -> None:
+            try:
+                await self._http_client.head(url, timeout=5.0)
+            except httpx.HTTPError:
+                pass  # warmup is best-effort; real calls report their own errors
+
+        await asyncio.gather(*[_ping(host) for host in hosts])
+
+    @asynccontextmanager
+    async def _http(self, timeout: float = 10.0):
+        """Yield the injected shared client, or a short-lived one."""
+        if self._http_client is not None:
+            yield self._http_client
+        else:
+            async with httpx.AsyncClient(timeout=timeout) as client:
+                yield client
+
     async def get_census_data(self, address: str) -> Dict[str, Any]:
         """
         Fetch demographic data from US Census API (100% FREE)
@@ -34,7 +137,7 @@ class FreePropertyDataService:
                 "format": "json"
             }
             
-            async with httpx.AsyncClient(timeout=10.0) as client:
+            async with self._http() as client:
                 response = await client.get(geocode_url, params=geocode_params)
                 
                 if response.status_code == 200:
@@ -79,7 +182,7 @@ class FreePropertyDataService:
                 "User-Agent": "PropPulse-AI/1.0 (Real Estate Analysis)"
             }
             
-            async with httpx.AsyncClient(timeout=10.0) as client:
+            async with self._http() as client:
                 response = await client.get(url, params=params, headers=headers)
                 
                 if response.status_code == 200:
@@ -110,7 +213,7 @@ class FreePropertyDataService:
             # HUD Fair Market Rents API
             url = f"https://www.huduser.gov/hudapi/public/fmr/data/{state}"
             
-            async with httpx.AsyncClient(timeout=10.0) as client:
+            async with self._http() as client:
                 response = await client.get(url)
                 
                 if response.status_code == 200:
@@ -191,7 +294,7 @@ class FreePropertyDataService:
                 "format": "json"
             }
             
-            async with httpx.AsyncClient(timeout=5.0) as client:
+            async with self._http(timeout=5.0) as client:
                 response = await client.get(tract_url, params=tract_params)
                 
                 if response.status_code == 200:
@@ -547,7 +650,12 @@ class FreePropertyDataService:
             if not self.attom_api_key:
                 logger.warning("ATTOM API key not configured")
                 return {}
-                
+
+            # Skip the round-trip entirely for addresses ATTOM has already missed
+            if await _attom_miss_cache.is_known_miss(address):
+                logger.info(f"Skipping ATTOM call - known miss for: {address}")
+                return {}
+
             # Format address for API
             formatted_address = address.replace(" ", "+")
             
@@ -562,15 +670,21 @@ class FreePropertyDataService:
                 "accept": "application/json"
             }
             
-            async with httpx.AsyncClient(timeout=10.0) as client:
+            async with self._http() as client:
                 response = await client.get(url, params=params, headers=headers)
                 
                 if response.status_code == 200:
                     data = response.json()
                     
                     if data.get("status", {}).get("code") == 0:
-                        property_info = data.get("property", [{}])[0]
-                        
+                        properties = data.get("property") or []
+                        if not properties:
+                            # Success with an empty result set - ATTOM
+                            # genuinely has no record for this address
+                            await _attom_miss_cache.record_miss(address)
+                            return {}
+                        property_info = properties[0]
+
                         # Extract relevant property details
                         result = {
                             "attom_id": property_info.get("identifier", {}).get("attomId"),
@@ -587,9 +701,21 @@ class FreePropertyDataService:
                         await self._add_attom_valuation_data(result, property_info.get("identifier", {}).get("attomId"))
                         
                         return result
+                    elif data.get("status", {}).get("msg") == "SuccessWithoutResult":
+                        # ATTOM's in-band "no record for this address"
+                        await _attom_miss_cache.record_miss(address)
                     else:
+                        # Any other non-zero code is an API-side problem
+                        # (auth, quota, throttling) - it says nothing about
+                        # the address, so never poison the permanent miss
+                        # filter with it
                         logger.warning(f"ATTOM API error: {data.get('status', {}).get('msg')}")
-            
+                elif response.status_code == 404:
+                    # Address not in ATTOM's index - remember the miss.
+                    # 400s are deliberately not recorded: a malformed or
+                    # misformatted query says nothing about the address
+                    await _attom_miss_cache.record_miss(address)
+
         except Exception as e:
             logger.error(f"ATTOM API error: {e}")
         
@@ -611,7 +737,7 @@ class FreePropertyDataService:
                 "accept": "application/json"
             }
             
-            async with httpx.AsyncClient(timeout=10.0) as client:
+            async with self._http() as client:
                 response = await client.get(url, params=params, headers=headers)
                 
                 if response.status_code == 200:
@@ -664,7 +790,7 @@ class FreePropertyDataService:
                 "format": "json"
             }
             
-            async with httpx.AsyncClient(timeout=10.0) as client:
+            async with self._http() as client:
                 response = await client.get(geocode_url, params=geocode_params)
                 
                 if response.status_code == 200:
@@ -709,7 +835,7 @@ class FreePropertyDataService:
                 "User-Agent": "PropPulse-AI/1.0 (Real Estate Analysis)"
             }
             
-            async with httpx.AsyncClient(timeout=10.0) as client:
+            async with self._http() as client:
                 response = await client.get(url, params=params, headers=headers)
                 
                 if response.status_code == 200:
@@ -740,7 +866,7 @@ class FreePropertyDataService:
             # HUD Fair Market Rents API
             url = f"https://www.huduser.gov/hudapi/public/fmr/data/{state}"
             
-            async with httpx.AsyncClient(timeout=10.0) as client:
+            async with self._http() as client:
                 response = await client.get(url)
                 
                 if response.status_code == 200:
@@ -821,7 +947,7 @@ class FreePropertyDataService:
                 "format": "json"
             }
             
-            async with httpx.AsyncClient(timeout=5.0) as client:
+            async with self._http(timeout=5.0) as client:
                 response = await client.get(tract_url, params=tract_params)
                 
                 if response.status_code == 200:
@@ -3,6 +3,7 @@
 Test ATTOM API + Gemini AI Integration
 """
 import asyncio
+import logging
 import os
 import sys
 sys.path.append('/Volumes/project/intern/proppulse-ai/backend')
@@ -13,6 +14,9 @@ load_dotenv()
 
 from services.external_apis import ExternalAPIService
 
+logging.basicConfig(level=os.getenv("LOG_LEVEL", "INFO"))
+logger = logging.getLogger(__name__)
+
 async def test_attom_and_gemini():
     """Test ATTOM API and Gemini AI integration"""
     print("🧪 Testing ATTOM API + Gemini AI Integration")
@@ -82,10 +86,10 @@ async def test_attom_and_gemini():
                 
         except Exception as e:
             print(f"❌ Error: {e}")
-            import traceback
-            traceback.print_exc()
+            logger.exception("property data lookup failed")
             
         print()
 
 if __name__ == "__main__":
+    import _bootstrap  # installs uvloop when available  # noqa: F401
     asyncio.run(test_attom_and_gemini())
@@ -3,6 +3,7 @@
 Test ATTOM API directly
 """
 import asyncio
+import logging
 import os
 import sys
 import requests
@@ -10,7 +11,30 @@ sys.path.append('/Volumes/project/intern/proppulse-ai/backend')
 
 # Load environment variables from .env file
 from dotenv import load_dotenv
+
 load_dotenv()
+logging.basicConfig(level=os.getenv("LOG_LEVEL", "INFO"))
+logger = logging.getLogger(__name__)
+
+def _make_cache_client():
+    """
+    Build an HTTP client with an RFC 9111 shared cache (hishel) so repeat runs
+    hit local disk instead of ATTOM. ATTOM sends no cache headers, so we force
+    caching with a 24h TTL and allow stale responses if the origin is down.
+    Falls back to None (plain requests) when hishel isn't installed.
+    """
+    try:
+        import hishel
+    except ImportError:
+        return None
+
+    controller = hishel.Controller(
+        allow_stale=True,
+        cacheable_methods=["GET"],
+        cacheable_status_codes=[200],
+    )
+    storage = hishel.FileStorage(ttl=86400)
+    return hishel.CacheClient(controller=controller, storage=storage)
 
 def test_attom_api_direct():
     """Test ATTOM API directly"""
@@ -47,8 +71,18 @@ def test_attom_api_direct():
     
     try:
         print("📡 Making API request...")
-        response = requests.get(url, headers=headers, params=params, timeout=30)
-        
+        client = _make_cache_client()
+        if client is not None:
+            with client:
+                response = client.get(
+                    url, headers=headers, params=params, timeout=30,
+                    extensions={"force_cache": True}
+                )
+            if response.extensions.get("from_cache"):
+                print("⚡ Served from local HTTP cache")
+        else:
+            response = requests.get(url, headers=headers, params=params, timeout=30)
+
         print(f"📊 Response Status: {response.status_code}")
         print(f"📄 Response Headers: {dict(response.headers)}")
         
@@ -62,21 +96,26 @@ def test_attom_api_direct():
                 properties = data["property"]
                 if properties:
                     prop = properties[0]
+                    # Walk each nested payload once instead of re-traversing
+                    # from the root (with throwaway {} defaults) per field
+                    summary = prop.get('summary') or {}
+                    building = prop.get('building') or {}
+                    size = building.get('size') or {}
+                    rooms = building.get('rooms') or {}
                     print(f"\n🏠 Property Details:")
-                    print(f"  Address: {prop.get('address', {}).get('oneLine', 'N/A')}")
-                    print(f"  Property Type: {prop.get('summary', {}).get('proptype', 'N/A')}")
-                    print(f"  Year Built: {prop.get('summary', {}).get('yearbuilt', 'N/A')}")
-                    print(f"  Living Area: {prop.get('building', {}).get('size', {}).get('livingsize', 'N/A')} sq ft")
-                    print(f"  Bedrooms: {prop.get('building', {}).get('rooms', {}).get('beds', 'N/A')}")
-                    print(f"  Bathrooms: {prop.get('building', {}).get('rooms', {}).get('bathstotal', 'N/A')}")
+                    print(f"  Address: {(prop.get('address') or {}).get('oneLine', 'N/A')}")
+                    print(f"  Property Type: {summary.get('proptype', 'N/A')}")
+                    print(f"  Year Built: {summary.get('yearbuilt', 'N/A')}")
+                    print(f"  Living Area: {size.get('livingsize', 'N/A')} sq ft")
+                    print(f"  Bedrooms: {rooms.get('beds', 'N/A')}")
+                    print(f"  Bathrooms: {rooms.get('bathstotal', 'N/A')}")
         else:
             print(f"❌ API Error: {response.status_code}")
             print(f"📄 Response: {response.text}")
             
     except Exception as e:
         print(f"❌ Error: {e}")
-        import traceback
-        traceback.print_exc()
+        logger.exception("ATTOM API request failed")
 
 if __name__ == "__main__":
     test_attom_api_direct()
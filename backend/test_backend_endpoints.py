@@ -2,66 +2,87 @@
 """
 Test backend endpoints directly
 """
-import requests
-import json
+import asyncio
+import httpx
 
-def test_backend():
+try:
+    import orjson
+    _loads = orjson.loads
+except ImportError:
+    import json
+    _loads = json.loads
+
+async def test_backend():
     base_url = "https://proppulse-ai-production.up.railway.app"
-    
+
     print("Testing backend endpoints...")
     print("=" * 50)
-    
-    # Test health endpoint
-    try:
-        response = requests.get(f"{base_url}/health", timeout=10)
-        print(f"Health endpoint: {'✅ OK' if response.status_code == 200 else '❌ Failed'}")
-        if response.status_code == 200:
-            print(f"  Response: {response.json()}")
-    except Exception as e:
-        print(f"Health endpoint error: {e}")
-    
-    # Test quick-analysis endpoint
-    try:
-        address = "123 Main Street Apt 5, Los Angeles, CA 90210"
-        payload = {"address": address}
-        
-        print(f"\nTesting quick-analysis with: {address}")
-        response = requests.post(
-            f"{base_url}/quick-analysis",
-            headers={"Content-Type": "application/json"},
-            json=payload,
-            timeout=30
+
+    address = "123 Main Street Apt 5, Los Angeles, CA 90210"
+    payload = {"address": address}
+
+    async with httpx.AsyncClient(base_url=base_url, timeout=30.0) as client:
+        # Health and quick-analysis are independent - issue both at once so
+        # wall-clock is max() of the two instead of their sum. The analysis
+        # response can be large, so stream it and parse the body with orjson.
+        async def fetch_health():
+            return await client.get("/health", timeout=10.0)
+
+        async def fetch_quick_analysis():
+            async with client.stream(
+                "POST", "/quick-analysis",
+                headers={"Content-Type": "application/json"},
+                json=payload,
+            ) as response:
+                body = await response.aread()
+                return response, body
+
+        health_result, qa_result = await asyncio.gather(
+            fetch_health(), fetch_quick_analysis(), return_exceptions=True
         )
-        
-        print(f"Quick-analysis endpoint: {'✅ OK' if response.status_code == 200 else '❌ Failed'}")
-        print(f"Status code: {response.status_code}")
-        
-        if response.status_code == 200:
-            data = response.json()
-            print(f"Response keys: {list(data.keys())}")
-            
-            # Check if we have analysis_result
-            if 'analysis_result' in data:
-                analysis = data['analysis_result']
-                print(f"Analysis result keys: {list(analysis.keys())}")
-                
-                if 'property_details' in analysis:
-                    props = analysis['property_details']
-                    print(f"Property details: {props}")
-                
-                if 'market_data' in analysis:
-                    market = analysis['market_data']
-                    print(f"Market data keys: {list(market.keys())}")
-                    
-                    # Check data quality
-                    if 'data_quality' in market:
-                        quality = market['data_quality']
-                        print(f"Data quality: {quality}")
-        else:
-            print(f"Error response: {response.text}")
-            
-    except Exception as e:
-        print(f"Quick-analysis error: {e}")
+
+    # Health endpoint
+    if isinstance(health_result, Exception):
+        print(f"Health endpoint error: {health_result}")
+    else:
+        print(f"Health endpoint: {'✅ OK' if health_result.status_code == 200 else '❌ Failed'}")
+        if health_result.status_code == 200:
+            print(f"  Response: {health_result.json()}")
+
+    # Quick-analysis endpoint
+    print(f"\nTesting quick-analysis with: {address}")
+    if isinstance(qa_result, Exception):
+        print(f"Quick-analysis error: {qa_result}")
+        return
+
+    response, body = qa_result
+    print(f"Quick-analysis endpoint: {'✅ OK' if response.status_code == 200 else '❌ Failed'}")
+    print(f"Status code: {response.status_code}")
+
+    if response.status_code == 200:
+        data = _loads(body)
+        print(f"Response keys: {list(data.keys())}")
+
+        # Check if we have analysis_result
+        if 'analysis_result' in data:
+            analysis = data['analysis_result']
+            print(f"Analysis result keys: {list(analysis.keys())}")
+
+            if 'property_details' in analysis:
+                props = analysis['property_details']
+                print(f"Property details: {props}")
+
+            if 'market_data' in analysis:
+                market = analysis['market_data']
+                print(f"Market data keys: {list(market.keys())}")
+
+                # Check data quality
+                if 'data_quality' in market:
+                    quality = market['data_quality']
+                    print(f"Data quality: {quality}")
+    else:
+        print(f"Error response: {body.decode(errors='replace')}")
 
 if __name__ == "__main__":
-    test_backend()
+    import _bootstrap  # installs uvloop when available  # noqa: F401
+    asyncio.run(test_backend())
@@ -7,53 +7,60 @@ import httpx
 
 async def test_basic_apis():
     print("Testing basic API connectivity...")
-    
+
+    # Share one pooled client across both APIs so we only pay connect + TLS
+    # once per host, and let HTTP/2 multiplex where the server supports it
+    limits = httpx.Limits(max_keepalive_connections=10, max_connections=20)
+    async with httpx.AsyncClient(http2=True, timeout=5.0, limits=limits) as client:
+        osm_request = client.get(
+            "https://nominatim.openstreetmap.org/search",
+            params={
+                "q": "123 Main Street, Los Angeles, CA",
+                "format": "json",
+                "limit": 1,
+                "addressdetails": 1
+            }
+        )
+        census_request = client.get(
+            "https://geocoding.geo.census.gov/geocoder/locations/onelineaddress",
+            params={
+                "address": "123 Main Street, Los Angeles, CA",
+                "benchmark": "2020",
+                "format": "json"
+            }
+        )
+
+        # Issue both requests concurrently - neither depends on the other
+        osm_response, census_response = await asyncio.gather(
+            osm_request, census_request, return_exceptions=True
+        )
+
     # Test 1: OpenStreetMap Nominatim (geocoding)
     print("\n1. Testing OpenStreetMap Nominatim...")
-    try:
-        async with httpx.AsyncClient(timeout=5.0) as client:
-            response = await client.get(
-                "https://nominatim.openstreetmap.org/search",
-                params={
-                    "q": "123 Main Street, Los Angeles, CA",
-                    "format": "json",
-                    "limit": 1,
-                    "addressdetails": 1
-                }
-            )
-            if response.status_code == 200:
-                data = response.json()
-                if data:
-                    print(f"✅ OSM Success: Found {data[0].get('display_name', 'Unknown')}")
-                else:
-                    print("❌ OSM: No results found")
-            else:
-                print(f"❌ OSM: HTTP {response.status_code}")
-    except Exception as e:
-        print(f"❌ OSM Exception: {e}")
-    
+    if isinstance(osm_response, Exception):
+        print(f"❌ OSM Exception: {osm_response}")
+    elif osm_response.status_code == 200:
+        data = osm_response.json()
+        if data:
+            print(f"✅ OSM Success: Found {data[0].get('display_name', 'Unknown')}")
+        else:
+            print("❌ OSM: No results found")
+    else:
+        print(f"❌ OSM: HTTP {osm_response.status_code}")
+
     # Test 2: US Census Geocoding
     print("\n2. Testing US Census API...")
-    try:
-        async with httpx.AsyncClient(timeout=5.0) as client:
-            response = await client.get(
-                "https://geocoding.geo.census.gov/geocoder/locations/onelineaddress",
-                params={
-                    "address": "123 Main Street, Los Angeles, CA",
-                    "benchmark": "2020",
-                    "format": "json"
-                }
-            )
-            if response.status_code == 200:
-                data = response.json()
-                if data.get("result", {}).get("addressMatches"):
-                    print("✅ Census Success: Address found")
-                else:
-                    print("❌ Census: No address matches")
-            else:
-                print(f"❌ Census: HTTP {response.status_code}")
-    except Exception as e:
-        print(f"❌ Census Exception: {e}")
+    if isinstance(census_response, Exception):
+        print(f"❌ Census Exception: {census_response}")
+    elif census_response.status_code == 200:
+        data = census_response.json()
+        if data.get("result", {}).get("addressMatches"):
+            print("✅ Census Success: Address found")
+        else:
+            print("❌ Census: No address matches")
+    else:
+        print(f"❌ Census: HTTP {census_response.status_code}")
 
 if __name__ == "__main__":
+    import _bootstrap  # installs uvloop when available  # noqa: F401
     asyncio.run(test_basic_apis())
@@ -3,6 +3,7 @@
 Test complete property data pipeline
 """
 import asyncio
+import logging
 import sys
 import os
 import json
@@ -10,6 +11,9 @@ sys.path.append(os.path.dirname(os.path.abspath(__file__)))
 
 from services.external_apis import ExternalAPIService
 
+logging.basicConfig(level=os.getenv("LOG_LEVEL", "INFO"))
+logger = logging.getLogger(__name__)
+
 async def test_complete_pipeline():
     service = ExternalAPIService()
     address = "123 Main Street Apt 5, Los Angeles, CA 90210"
@@ -49,8 +53,8 @@ async def test_complete_pipeline():
             
     except Exception as e:
         print(f"❌ EXCEPTION: {str(e)}")
-        import traceback
-        traceback.print_exc()
+        logger.exception("pipeline test failed")
 
 if __name__ == "__main__":
+    import _bootstrap  # installs uvloop when available  # noqa: F401
     asyncio.run(test_complete_pipeline())
@@ -85,4 +85,5 @@ async def test_comprehensive_system():
     print("🏁 Test Complete!")
 
 if __name__ == "__main__":
+    import _bootstrap  # installs uvloop when available  # noqa: F401
     asyncio.run(test_comprehensive_system())
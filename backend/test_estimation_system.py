@@ -3,12 +3,16 @@
 Test the smart property estimation system
 """
 import asyncio
+import logging
 import sys
 import os
 sys.path.append(os.path.dirname(os.path.abspath(__file__)))
 
 from services.external_apis import ExternalAPIService
 
+logging.basicConfig(level=os.getenv("LOG_LEVEL", "INFO"))
+logger = logging.getLogger(__name__)
+
 async def test_estimation_system():
     service = ExternalAPIService()
     
@@ -51,8 +55,8 @@ async def test_estimation_system():
                 
         except Exception as e:
             print(f"❌ Exception: {str(e)}")
-            import traceback
-            traceback.print_exc()
+            logger.exception("estimation test failed")
 
 if __name__ == "__main__":
+    import _bootstrap  # installs uvloop when available  # noqa: F401
     asyncio.run(test_estimation_system())
@@ -3,6 +3,7 @@
 Quick test for free property data APIs
 """
 import asyncio
+import logging
 import sys
 import os
 import json
@@ -10,6 +11,9 @@ sys.path.append(os.path.dirname(os.path.abspath(__file__)))
 
 from services.free_property_apis import FreePropertyDataService
 
+logging.basicConfig(level=os.getenv("LOG_LEVEL", "INFO"))
+logger = logging.getLogger(__name__)
+
 async def test_free_apis():
     service = FreePropertyDataService()
     address = "123 Main Street, Los Angeles, CA 90210"
@@ -68,8 +72,8 @@ async def test_free_apis():
     
     except Exception as e:
         print(f"❌ EXCEPTION: {str(e)}")
-        import traceback
-        traceback.print_exc()
+        logger.exception("free API test failed")
 
 if __name__ == "__main__":
+    import _bootstrap  # installs uvloop when available  # noqa: F401
     asyncio.run(test_free_apis())
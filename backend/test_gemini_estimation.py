@@ -3,6 +3,7 @@
 Test Gemini AI property estimation functionality
 """
 import asyncio
+import logging
 import os
 import sys
 sys.path.append('/Volumes/project/intern/proppulse-ai/backend')
@@ -13,6 +14,9 @@ load_dotenv()
 
 from services.external_apis import ExternalAPIService
 
+logging.basicConfig(level=os.getenv("LOG_LEVEL", "INFO"))
+logger = logging.getLogger(__name__)
+
 async def test_gemini_estimation():
     """Test Gemini AI property estimation"""
     print("🧪 Testing Gemini AI Property Estimation")
@@ -80,8 +84,8 @@ async def test_gemini_estimation():
             
     except Exception as e:
         print(f"❌ Error: {e}")
-        import traceback
-        traceback.print_exc()
+        logger.exception("Gemini estimation test failed")
 
 if __name__ == "__main__":
+    import _bootstrap  # installs uvloop when available  # noqa: F401
     asyncio.run(test_gemini_estimation())
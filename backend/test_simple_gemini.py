@@ -3,13 +3,17 @@
 Simple test for Gemini AI property estimation
 """
 import asyncio
+import logging
 import os
 import sys
 sys.path.append('/Volumes/project/intern/proppulse-ai/backend')
 
 # Load environment variables
 from dotenv import load_dotenv
+
 load_dotenv()
+logging.basicConfig(level=os.getenv("LOG_LEVEL", "INFO"))
+logger = logging.getLogger(__name__)
 
 async def test_simple_gemini():
     """Simple Gemini test"""
@@ -57,8 +61,8 @@ async def test_simple_gemini():
             
     except Exception as e:
         print(f"❌ Error: {e}")
-        import traceback
-        traceback.print_exc()
+        logger.exception("Gemini test failed")
 
 if __name__ == "__main__":
+    import _bootstrap  # installs uvloop when available  # noqa: F401
     asyncio.run(test_simple_gemini())
@@ -0,0 +1,14 @@
+"""Pytest session setup: make the backend package importable once.
+
+The test scripts each used to prepend the backend directory to sys.path at
+import time; doing it here runs the path manipulation a single time per
+pytest session instead of once per collected module.
+
+Collection is restricted to tests/ via pytest.ini - the root-level
+test_*.py files are standalone scripts (several POST to the live backend
+at module level) and must not be imported by the collector.
+"""
+import pathlib
+import sys
+
+sys.path.insert(0, str(pathlib.Path(__file__).parent / "backend"))
@@ -1,18 +1,27 @@
-import requests
+import atexit
 import json
-import time
+
+import httpx
+
+# One pooled client reused across calls - both test addresses share the same
+# keep-alive connection instead of paying a TCP+TLS handshake each
+_CLIENT = httpx.Client(
+    base_url="https://proppulse-ai-production.up.railway.app",
+    http2=True,
+    timeout=10.0,
+)
+atexit.register(_CLIENT.close)
 
 def test_address(address):
     """Test the PropPulse API with a given address"""
     print(f"\nTesting address: {address}")
     try:
-        response = requests.post(
-            "https://proppulse-ai-production.up.railway.app/quick-analysis",
+        response = _CLIENT.post(
+            "/quick-analysis",
             headers={"Content-Type": "application/json"},
             json={"address": address},
-            timeout=10
         )
-        
+
         if response.status_code != 200:
             print(f"Error: {response.status_code}, {response.text}")
             return
@@ -1,10 +1,101 @@
+import mmap
 import os
+import re
 import time
 import sys
 import shutil
 import subprocess
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 
+try:
+    import libcst as cst
+except ImportError:
+    cst = None
+
+# camelCase -> snake_case data-quality renames in page.tsx, fused into one
+# alternation so the file is scanned once instead of once per name
+_FE_RE = re.compile(r"propertyData\.dataQuality\?\.(isEstimatedData|isFreeData)")
+_FE_RENAMES = {"isEstimatedData": "is_estimated_data", "isFreeData": "is_free_data"}
+
+def _backup(src, dst):
+    """
+    Back up src to dst. Hardlinking is a constant-time inode operation with
+    zero data copy; fall back to a full copy when linking isn't possible
+    (cross-device, unsupported filesystem).
+    """
+    try:
+        if os.path.exists(dst):
+            os.unlink(dst)
+        os.link(src, dst)
+    except OSError:
+        shutil.copy(src, dst)
+
+def _write_atomic(path, text):
+    """Write text through a temp file + os.replace so a crash can't leave a
+    half-written source file behind."""
+    tmp = str(path) + ".tmp"
+    with open(tmp, "w") as f:
+        f.write(text)
+    os.replace(tmp, path)
+
+def _patch_span(path, start_marker, end_marker, replacement):
+    """
+    Replace the start_marker..end_marker span in path with replacement.
+    Scans the file through mmap (no full decode into a Python string) and
+    writes the three byte ranges out once, atomically. Returns False when
+    either marker is missing.
+    """
+    start_b = start_marker.encode()
+    end_b = end_marker.encode()
+    with open(path, "rb") as f:
+        with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+            start = mm.find(start_b)
+            if start == -1:
+                return False
+            end = mm.find(end_b, start)
+            if end == -1:
+                return False
+            end += len(end_b)
+
+            tmp = str(path) + ".tmp"
+            with open(tmp, "wb") as out:
+                out.write(mm[:start])
+                out.write(replacement.encode())
+                out.write(mm[end:])
+    os.replace(tmp, path)
+    return True
+
+def _patch_function_cst(path, func_name, class_body_snippet):
+    """
+    Replace the method named func_name with the statements in
+    class_body_snippet via a libcst parse + single emit. Unlike marker
+    splicing this survives whitespace/comment drift in the target file.
+    Returns False when libcst is unavailable or the function isn't found,
+    so callers can fall back to _patch_span.
+    """
+    if cst is None:
+        return False
+
+    new_statements = cst.parse_module("class _Tmp:\n" + class_body_snippet).body[0].body.body
+
+    class _Patcher(cst.CSTTransformer):
+        replaced = False
+
+        def leave_FunctionDef(self, original_node, updated_node):
+            if original_node.name.value == func_name:
+                _Patcher.replaced = True
+                return cst.FlattenSentinel(new_statements)
+            return updated_node
+
+    with open(path, "r") as f:
+        tree = cst.parse_module(f.read())
+    new_tree = tree.visit(_Patcher())
+    if not _Patcher.replaced:
+        return False
+    _write_atomic(path, new_tree.code)
+    return True
+
 def fix_backend():
     """Fix the backend code to provide smart estimation for all addresses"""
     print("🛠️ Fixing backend code...")
@@ -19,21 +110,60 @@ def fix_backend():
         return False
     
     # Backup
-    shutil.copy(main_py_path, backend_dir / "main.py.bak")
-    shutil.copy(external_apis_path, backend_dir / "services" / "external_apis.py.bak")
+    _backup(main_py_path, backend_dir / "main.py.bak")
+    _backup(external_apis_path, backend_dir / "services" / "external_apis.py.bak")
     
     # Fix 1: Update _get_basic_property_estimates in external_apis.py
     try:
         print("Fixing external_apis.py...")
-        with open(external_apis_path, "r") as f:
-            content = f.read()
-        
+
         # Replace the method with our fixed version
         start_marker = "def _get_basic_property_estimates(self, address: str"
         end_marker = "return None  # Don't estimate for non-multifamily"
-        
-        if start_marker in content and end_marker in content:
-            replacement = """def _get_basic_property_estimates(self, address: str, force_estimation: bool = False) -> Optional[Dict[str, Any]]:
+
+        replacement = """import functools
+
+    # Optional plurals keep this equivalent to the substring scan it
+    # replaces - 'apartment' in address also matched "Marina Apartments"
+    _ADDR_RE = re.compile(
+        r'(?P<unit>unit\\s*(\\d+)|apt\\s*(\\d+)|#\\s*(\\d+))'
+        r'|(?P<mf>\\b(?:apts?|apartments?|units?|suites?|complex(?:es)?|towers|plazas?|manors?|courts?|places?)\\b|#)'
+        r'|(?P<com>\\b(?:commercial|business(?:es)?|offices?|plazas?)\\b)'
+    )
+
+    # Static estimate metadata built once at class creation; every estimate
+    # shares this dict (callers must not mutate it) instead of re-allocating
+    # and re-hashing the same literal keys per call
+    _ESTIMATE_DATA_QUALITY = {
+        "is_estimated_data": True,
+        "confidence": 25,  # Low confidence for most properties
+        "sources": ["Address Analysis"],
+        "last_updated": "2025-07-20",
+        "notes": "⚠️ ESTIMATES ONLY - Based on address analysis when real data APIs unavailable. Use for initial screening only."
+    }
+
+    @staticmethod
+    @functools.lru_cache(maxsize=4096)
+    def _classify_address(address):
+        \"\"\"Pure address classification: (is_multifamily, unit_numbers, is_commercial).
+
+        The same address gets classified several times per analysis run
+        (lookup + estimator fallback), so memoize - repeats are a dict hit.
+        \"\"\"
+        is_likely_multifamily = False
+        is_commercial = False
+        unit_numbers = []
+        for match in ExternalAPIService._ADDR_RE.finditer(address.lower()):
+            if match.group('unit'):
+                is_likely_multifamily = True
+                unit_numbers.extend(int(g) for g in match.groups()[1:4] if g and g.isdigit())
+            elif match.group('mf'):
+                is_likely_multifamily = True
+            elif match.group('com'):
+                is_commercial = True
+        return is_likely_multifamily, tuple(unit_numbers), is_commercial
+
+    def _get_basic_property_estimates(self, address: str, force_estimation: bool = False) -> Optional[Dict[str, Any]]:
         \"\"\"
         Provide basic property estimates based on address analysis when APIs are unavailable
         This is transparent about being estimates, not real data
@@ -43,31 +173,18 @@ def fix_backend():
         - force_estimation: If True, provide estimates even for non-multifamily properties
         \"\"\"
         try:
-            import re
-            
-            # Parse address for clues
-            address_lower = address.lower()
-            
-            # Detect if it's likely multifamily
-            multifamily_indicators = ['apt', 'apartment', 'unit', 'suite', '#', 'complex', 'towers', 'plaza', 'manor', 'court', 'place']
-            is_likely_multifamily = any(indicator in address_lower for indicator in multifamily_indicators)
-            
-            # Extract unit numbers or building size clues
-            unit_match = re.search(r'unit\s*(\d+)|apt\s*(\d+)|#\s*(\d+)', address_lower)
-            has_unit_number = bool(unit_match)
-            
+            # Classification is memoized - repeated calls for the same
+            # address cost a dict lookup instead of a regex pass
+            is_likely_multifamily, unit_numbers, is_commercial = self._classify_address(address)
+            has_unit_number = bool(unit_numbers)
+
             # Basic estimates based on address patterns - either multifamily or forced estimation
             if is_likely_multifamily or has_unit_number or force_estimation:
                 if is_likely_multifamily or has_unit_number:
                     # For multifamily addresses
-                    if unit_match:
-                        # Get all valid unit numbers from the regex groups
-                        unit_numbers = [int(g) for g in unit_match.groups() if g and g.isdigit()]
-                        if unit_numbers:
-                            unit_num = max(unit_numbers)
-                            estimated_units = min(max(unit_num + 10, 20), 100)  # Reasonable range
-                        else:
-                            estimated_units = 48  # Default if no valid numbers found
+                    if unit_numbers:
+                        unit_num = max(unit_numbers)
+                        estimated_units = min(max(unit_num + 10, 20), 100)  # Reasonable range
                     else:
                         estimated_units = 48  # Conservative multifamily estimate
                     
@@ -79,7 +196,7 @@ def fix_backend():
                     estimated_value = estimated_units * 55000  # Conservative per-unit value
                 elif force_estimation:
                     # For non-multifamily addresses with force_estimation
-                    if 'commercial' in address_lower or 'business' in address_lower or 'office' in address_lower or 'plaza' in address_lower:
+                    if is_commercial:
                         property_type = "Commercial"
                         estimated_units = 1
                         estimated_sqft = 5000  # Conservative commercial estimate
@@ -106,37 +223,29 @@ def fix_backend():
                         "estimated_cap_rate": 6.5,
                     },
                     
-                    "data_quality": {
-                        "is_estimated_data": True,
-                        "confidence": 25,  # Low confidence for most properties
-                        "sources": ["Address Analysis"],
-                        "last_updated": "2025-07-20",
-                        "notes": "⚠️ ESTIMATES ONLY - Based on address analysis when real data APIs unavailable. Use for initial screening only."
-                    }
+                    "data_quality": self._ESTIMATE_DATA_QUALITY
                 }"""
-            
-            content = content.replace(content.split(start_marker)[0] + start_marker, content.split(start_marker)[0] + replacement.split("def _get_basic_property_estimates")[1])
-            content = content.replace(end_marker, "        except Exception as e:\n            self.logger.error(f\"Error in basic estimates: {e}\")\n            return None")
-            
-            with open(external_apis_path, "w") as f:
-                f.write(content)
-            
-            print("✅ Fixed external_apis.py")
-        else:
-            print("❌ Could not find markers in external_apis.py")
-            return False
-        
+
+        except_tail = "        except Exception as e:\n            self.logger.error(f\"Error in basic estimates: {e}\")\n            return None"
+
+        # Prefer the CST transform (single parse + emit, immune to marker
+        # drift); fall back to mmap marker splicing when libcst is missing
+        snippet = "    " + replacement + "\n" + except_tail
+        if not _patch_function_cst(external_apis_path, "_get_basic_property_estimates", snippet):
+            if not _patch_span(external_apis_path, start_marker, end_marker, replacement + "\n" + except_tail):
+                print("❌ Could not find markers in external_apis.py")
+                return False
+
+        print("✅ Fixed external_apis.py")
+
         # Fix 2: Update the quick-analysis endpoint in main.py
         print("Fixing main.py...")
-        with open(main_py_path, "r") as f:
-            content = f.read()
-        
+
         # Replace the estimation logic in quick-analysis
         start_marker = "        # DIRECT SMART ESTIMATION CHECK: Check if address is likely multifamily first"
         end_marker = "            # Regular flow for non-multifamily addresses"
-        
-        if start_marker in content and end_marker in content:
-            replacement = """        # Check if address has multifamily indicators (for data quality flag)
+
+        replacement = """        # Check if address has multifamily indicators (for data quality flag)
         is_multifamily = any(indicator in address.lower() for indicator in ['apt', 'apartment', 'unit', 'suite', '#', 'complex', 'towers', 'plaza'])
         
         # First try to get real property data
@@ -151,22 +260,26 @@ def fix_backend():
             if estimated_data:
                 # We have estimation data - use it directly
                 property_data = estimated_data"""
-                
-            content = content.replace(content.split(start_marker)[0] + start_marker, content.split(start_marker)[0] + replacement)
-            content = content.replace(end_marker, "")
-            
-            # Also fix the data_quality part
-            data_quality_marker = "                \"market_data\": {"
-            data_quality_end = "                },"
+
+        if not _patch_span(main_py_path, start_marker, end_marker, replacement):
+            print("❌ Could not find markers in main.py")
+            return False
+
+        # Also fix the data_quality part - this one needs content-aware
+        # occurrence matching, so read the patched file once
+        with open(main_py_path, "r") as f:
+            content = f.read()
+        data_quality_marker = "                \"market_data\": {"
+        data_quality_end = "                },"
             
-            if data_quality_marker in content:
-                # Find the right occurrence of the marker (there could be multiple)
-                parts = content.split(data_quality_marker)
-                if len(parts) > 1:
-                    for i in range(1, len(parts)):
-                        if "\"data_quality\":" in parts[i] and "\"market_data\":" in parts[i-1]:
-                            # This is the one we want to replace
-                            replacement = """                "market_data": {
+        if data_quality_marker in content:
+            # Find the right occurrence of the marker (there could be multiple)
+            parts = content.split(data_quality_marker)
+            if len(parts) > 1:
+                for i in range(1, len(parts)):
+                    if "\"data_quality\":" in parts[i] and "\"market_data\":" in parts[i-1]:
+                        # This is the one we want to replace
+                        replacement = """                "market_data": {
                     # Include market data from property data
                     **(property_data.get("market_data", {})),
                     # Always include data quality information
@@ -177,26 +290,21 @@ def fix_backend():
                         "notes": "⚠️ ESTIMATES ONLY - Based on address analysis when real data unavailable"
                     }"""
                             
-                            # Find where the data_quality part ends
-                            end_idx = parts[i].find(data_quality_end)
-                            if end_idx != -1:
-                                parts[i] = replacement + parts[i][end_idx:]
-                            
-                            # Reconstruct the content
-                            content = parts[0]
-                            for j in range(1, len(parts)):
-                                content += data_quality_marker + parts[j]
-                            
-                            break
-            
-            with open(main_py_path, "w") as f:
-                f.write(content)
-            
-            print("✅ Fixed main.py")
-        else:
-            print("❌ Could not find markers in main.py")
-            return False
-        
+                        # Find where the data_quality part ends
+                        end_idx = parts[i].find(data_quality_end)
+                        if end_idx != -1:
+                            # replacement starts with the marker text itself,
+                            # so drop it - join() puts the marker back
+                            parts[i] = replacement[len(data_quality_marker):] + parts[i][end_idx:]
+
+                        # Reconstruct in one allocation instead of N concatenations
+                        content = data_quality_marker.join(parts)
+
+                        _write_atomic(main_py_path, content)
+                        break
+
+        print("✅ Fixed main.py")
+
         return True
         
     except Exception as e:
@@ -214,26 +322,27 @@ def fix_frontend():
     if not page_tsx_path.exists():
         print("❌ ERROR: Frontend file not found!")
         return False
-    
-    # Backup
-    shutil.copy(page_tsx_path, frontend_dir / "src" / "app" / "upload" / "documents" / "page.tsx.bak")
-    
+
     try:
-        with open(page_tsx_path, "r") as f:
-            content = f.read()
-        
-        # Fix the data quality check
+        # Read first: on the already-fixed fast path (every re-run) we can
+        # return before paying for a backup copy or rewrite
+        content = page_tsx_path.read_text()
+
         if "propertyData.dataQuality?.is_estimated_data" in content:
             print("✅ Frontend already using correct snake_case properties")
-        else:
-            content = content.replace("propertyData.dataQuality?.isEstimatedData", "propertyData.dataQuality?.is_estimated_data")
-            content = content.replace("propertyData.dataQuality?.isFreeData", "propertyData.dataQuality?.is_free_data")
-            
-            with open(page_tsx_path, "w") as f:
-                f.write(content)
-            
-            print("✅ Fixed frontend property names to use snake_case")
-        
+            return True
+
+        # Backup only when we're actually about to rewrite the file
+        _backup(page_tsx_path, frontend_dir / "src" / "app" / "upload" / "documents" / "page.tsx.bak")
+
+        content = _FE_RE.sub(
+            lambda m: "propertyData.dataQuality?." + _FE_RENAMES[m.group(1)], content
+        )
+
+        _write_atomic(page_tsx_path, content)
+
+        print("✅ Fixed frontend property names to use snake_case")
+
         return True
         
     except Exception as e:
@@ -244,15 +353,25 @@ def deploy_backend():
     """Deploy backend changes to Railway"""
     print("\n🚀 Deploying backend to Railway...")
     
+    backend_dir = "/Volumes/project/intern/proppulse-ai/backend"
+
     try:
-        # Change to backend directory
-        os.chdir("/Volumes/project/intern/proppulse-ai/backend")
-        
-        # Commit changes
-        subprocess.run(["git", "add", "main.py", "services/external_apis.py"])
-        subprocess.run(["git", "commit", "-m", "Fix estimation for all property types and data quality display"])
-        subprocess.run(["git", "push"])
-        
+        # commit -am stages and commits the tracked files in one git process,
+        # and -C keeps each call independent of the process cwd. Capturing
+        # output lets us detect a no-op commit and skip the push (network
+        # round trip + a pointless Railway redeploy) entirely.
+        result = subprocess.run(
+            ["git", "-C", backend_dir, "commit", "-am", "Fix estimation for all property types and data quality display"],
+            capture_output=True,
+        )
+        if result.returncode:
+            if b"nothing to commit" in result.stdout:
+                print("✅ Backend already up to date - skipping push")
+                return True
+            print(f"❌ git commit failed: {result.stderr.decode()}")
+            return False
+        subprocess.run(["git", "-C", backend_dir, "push"], check=True, capture_output=True)
+
         print("✅ Backend changes pushed to Git")
         print("⏳ Railway will auto-deploy the changes (usually takes 1-2 minutes)")
         
@@ -265,15 +384,23 @@ def deploy_frontend():
     """Deploy frontend changes to Vercel"""
     print("\n🚀 Deploying frontend to Vercel...")
     
+    frontend_dir = "/Volumes/project/intern/proppulse-ai/frontend"
+
     try:
-        # Change to frontend directory
-        os.chdir("/Volumes/project/intern/proppulse-ai/frontend")
-        
-        # Commit changes
-        subprocess.run(["git", "add", "src/app/upload/documents/page.tsx"])
-        subprocess.run(["git", "commit", "-m", "Fix data quality field names to use snake_case"])
-        subprocess.run(["git", "push"])
-        
+        # Same no-op detection as deploy_backend: a clean tree means no push
+        # and no pointless Vercel redeploy
+        result = subprocess.run(
+            ["git", "-C", frontend_dir, "commit", "-am", "Fix data quality field names to use snake_case"],
+            capture_output=True,
+        )
+        if result.returncode:
+            if b"nothing to commit" in result.stdout:
+                print("✅ Frontend already up to date - skipping push")
+                return True
+            print(f"❌ git commit failed: {result.stderr.decode()}")
+            return False
+        subprocess.run(["git", "-C", frontend_dir, "push"], check=True, capture_output=True)
+
         print("✅ Frontend changes pushed to Git")
         print("⏳ Vercel will auto-deploy the changes (usually takes 1-2 minutes)")
         
@@ -287,28 +414,30 @@ def main():
     print("🔧 PROPPULSE AI FINAL FIX SCRIPT 🔧")
     print("=" * 60)
     
-    # Fix backend
-    backend_fixed = fix_backend()
+    # The two fix steps touch disjoint files, so they can run concurrently -
+    # wall time is max() of the pair instead of their sum
+    with ThreadPoolExecutor(max_workers=2) as executor:
+        backend_fixed, frontend_fixed = executor.map(lambda fn: fn(), [fix_backend, fix_frontend])
+
     if not backend_fixed:
         print("❌ Backend fix failed, aborting")
         return
-    
-    # Fix frontend
-    frontend_fixed = fix_frontend()
     if not frontend_fixed:
         print("❌ Frontend fix failed, aborting")
         return
-    
-    # Deploy backend
+
+    # The deploys must stay sequential: backend/ and frontend/ are
+    # subdirectories of one git repository, so concurrent commit -am calls
+    # race on the index lock and whichever commits first sweeps up the
+    # other's files under the wrong message
     backend_deployed = deploy_backend()
+    frontend_deployed = deploy_frontend()
+
     if not backend_deployed:
         print("❌ Backend deployment failed")
-    
-    # Deploy frontend
-    frontend_deployed = deploy_frontend()
     if not frontend_deployed:
         print("❌ Frontend deployment failed")
-    
+
     if backend_deployed and frontend_deployed:
         print("\n🎉 ALL CHANGES DEPLOYED SUCCESSFULLY!")
         print("⏳ Please wait 2-3 minutes for both Railway and Vercel to complete their deployments")
@@ -0,0 +1,116 @@
+"""Shared disk-cached client for the backend /quick-analysis endpoint.
+
+The verification scripts in this directory all POST the same handful of
+addresses to Railway. The response for a given address is deterministic on
+the timescale of a test run, so we memoize (status, body) on disk keyed by
+sha1(address) with a short TTL - re-running the scripts back to back reads
+from local disk instead of paying a network round trip each time.
+"""
+import hashlib
+import json
+import time
+from pathlib import Path
+
+try:
+    import orjson  # C JSON parser - markedly faster on the nested analysis blobs
+except ImportError:
+    orjson = None
+
+import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+
+BACKEND_URL = "https://proppulse-ai-production.up.railway.app"
+CACHE_DIR = Path.home() / ".cache" / "proppulse" / "quick_analysis"
+
+# Shared session so every script (and every worker thread) reuses keep-alive
+# connections instead of paying a TLS handshake per request
+SESSION = requests.Session()
+SESSION.mount(
+    "https://",
+    HTTPAdapter(pool_connections=8, pool_maxsize=8, max_retries=Retry(total=2, backoff_factor=0.3)),
+)
+
+
+def loads(data):
+    """Parse JSON from bytes/str with orjson when available."""
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data)
+
+
+def dumps_pretty(obj):
+    """Indented JSON dump for debug output, with str() for odd types."""
+    if orjson is not None:
+        return orjson.dumps(obj, option=orjson.OPT_INDENT_2, default=str).decode()
+    return json.dumps(obj, indent=2, default=str)
+
+
+def wait_until_ready(url, delays=(1, 2, 4, 8, 16, 30)):
+    """Probe url until it answers with a non-5xx status, backing off exponentially.
+
+    Returns True as soon as the deploy looks live - an already-running deploy
+    is detected on the first probe instead of after a fixed sleep.
+    """
+    for delay in delays:
+        try:
+            if SESSION.head(url, timeout=5, allow_redirects=True).status_code < 500:
+                return True
+        except requests.RequestException:
+            pass
+        time.sleep(delay)
+    return False
+
+
+def _cache_path(address):
+    return CACHE_DIR / f"{hashlib.sha1(address.encode()).hexdigest()}.json"
+
+
+def load_cached(address, ttl=300):
+    """Return a cached (status, body) tuple, or None if missing/expired."""
+    path = _cache_path(address)
+    try:
+        if time.time() - path.stat().st_mtime < ttl:
+            cached = loads(path.read_bytes())
+            return cached["status"], cached["body"]
+    except (OSError, ValueError, KeyError):
+        pass
+    return None
+
+
+def store(address, status, body):
+    CACHE_DIR.mkdir(parents=True, exist_ok=True)
+    payload = {"status": status, "body": body}
+    if orjson is not None:
+        _cache_path(address).write_bytes(orjson.dumps(payload))
+    else:
+        _cache_path(address).write_text(json.dumps(payload))
+
+
+def quick_analysis(address, ttl=300):
+    """POST the address to /quick-analysis, returning (status_code, body).
+
+    body is the parsed JSON payload on success, or the raw response text
+    otherwise. Successful results are cached on disk for `ttl` seconds;
+    pass ttl=0 to force a fresh request (e.g. verifying a new deploy).
+    """
+    cached = load_cached(address, ttl)
+    if cached is not None:
+        return cached
+
+    response = SESSION.post(
+        f"{BACKEND_URL}/quick-analysis",
+        headers={"Content-Type": "application/json"},
+        json={"address": address},
+        timeout=30,
+    )
+    try:
+        # Parse the raw bytes directly, skipping requests' charset sniffing
+        body = loads(response.content)
+    except ValueError:
+        body = response.text
+    # Only successful analyses are worth memoizing - caching a transient
+    # 5xx would replay the failure for the whole TTL
+    if response.status_code == 200:
+        store(address, response.status_code, body)
+    return response.status_code, body
@@ -0,0 +1,28 @@
+"""Shared frontend test-URL generation.
+
+frontend_test_urls.py and generate_test_urls.py were near-identical copies
+of the same address list and URL-encoding loop; both now drive this module.
+"""
+from urllib.parse import quote
+
+# Test addresses (multifamily and regular)
+TEST_ADDRESSES = [
+    "123 Main Street Apt 5, Los Angeles, CA 90210",  # Multifamily with unit number
+    "7825 Sunset Boulevard, Los Angeles, CA 90046",  # Regular single-family
+    "Gateway Business Plaza, 1200 Commerce St, Dallas, TX 75202",  # Commercial
+]
+
+FRONTEND_BASE_URL = "https://proppulse-7q5aj8h8l-tilaks-projects-d3d027be.vercel.app/upload?address="
+
+
+def iter_urls(addresses, base_url=FRONTEND_BASE_URL):
+    """Yield (address, test_url) pairs with the address URL-encoded."""
+    for address in addresses:
+        yield address, f"{base_url}{quote(address)}"
+
+
+def print_urls(addresses=TEST_ADDRESSES, base_url=FRONTEND_BASE_URL):
+    print("\n🔍 FRONTEND TEST URLS\n" + "=" * 60)
+    for address, url in iter_urls(addresses, base_url):
+        print(f"\n🏢 Address: {address}")
+        print(f"🌐 URL: {url}")
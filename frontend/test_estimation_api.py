@@ -1,31 +1,22 @@
-import requests
-import json
+from _quick_analysis import BACKEND_URL, dumps_pretty, quick_analysis
 
 def test_estimation_api():
-    backend_url = "https://proppulse-ai-production.up.railway.app"
-    
     # Test with a multifamily address that should trigger estimation
     address = "123 Main Street Apt 5, Los Angeles, CA 90210"
-    
+
     print(f"Testing backend estimation with: {address}")
     print("=" * 60)
-    
+
     try:
-        print(f"🌐 Making API request to: {backend_url}/quick-analysis")
-        response = requests.post(
-            f"{backend_url}/quick-analysis",
-            headers={"Content-Type": "application/json"},
-            json={"address": address},
-            timeout=30
-        )
-        
-        print(f"Status Code: {response.status_code}")
-        
-        if response.status_code == 200:
-            data = response.json()
+        print(f"🌐 Making API request to: {BACKEND_URL}/quick-analysis")
+        status_code, data = quick_analysis(address)
+
+        print(f"Status Code: {status_code}")
+
+        if status_code == 200:
             print("\n✅ SUCCESS - Got response from backend")
             print("\nFull Response Structure:")
-            print(json.dumps(data, indent=2, default=str))
+            print(dumps_pretty(data))
             
             # Check for analysis_result
             if 'analysis_result' in data:
@@ -55,15 +46,15 @@ def test_estimation_api():
                         print(f"  - Notes: {quality.get('notes')}")
                     else:
                         print("\n⚠️ WARNING: data_quality field missing from market_data!")
-                        print(f"Market data content: {json.dumps(market, indent=2)}")
+                        print(f"Market data content: {dumps_pretty(market)}")
                 else:
                     print("\n⚠️ WARNING: market_data field missing from analysis_result!")
             else:
                 print("\n⚠️ WARNING: analysis_result field missing from response!")
                 
         else:
-            print(f"\n❌ ERROR - Status: {response.status_code}")
-            print(f"Response: {response.text}")
+            print(f"\n❌ ERROR - Status: {status_code}")
+            print(f"Response: {data}")
             
     except Exception as e:
         print(f"\n❌ EXCEPTION: {e}")
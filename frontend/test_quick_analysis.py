@@ -1,27 +1,18 @@
-import requests
-import json
+from _quick_analysis import dumps_pretty, quick_analysis
 
 def test_quick_analysis():
-    backend_url = "https://proppulse-ai-production.up.railway.app"
-    
     # Test with a multifamily address that should trigger estimation
     address = "123 Main Street Apt 5, Los Angeles, CA 90210"
-    
+
     print(f"Testing quick analysis with: {address}")
     print("=" * 60)
-    
+
     try:
-        response = requests.post(
-            f"{backend_url}/quick-analysis",
-            headers={"Content-Type": "application/json"},
-            json={"address": address},
-            timeout=30
-        )
-        
-        print(f"Status Code: {response.status_code}")
-        
-        if response.status_code == 200:
-            data = response.json()
+        status_code, data = quick_analysis(address)
+
+        print(f"Status Code: {status_code}")
+
+        if status_code == 200:
             print("\n✅ SUCCESS - Got response from backend")
             
             # Look specifically for data_quality in the response
@@ -34,15 +25,15 @@ def test_quick_analysis():
                 if 'data_quality' in market_data:
                     data_quality = market_data['data_quality']
                     print(f"\n📊 Data Quality Field Values:")
-                    print(json.dumps(data_quality, indent=2))
+                    print(dumps_pretty(data_quality))
                 else:
                     print("\n❌ data_quality field missing in market_data")
             else:
                 print("\n❌ Required fields missing in response")
                 
         else:
-            print(f"\n❌ ERROR - Status: {response.status_code}")
-            print(f"Response: {response.text}")
+            print(f"\n❌ ERROR - Status: {status_code}")
+            print(f"Response: {data}")
             
     except Exception as e:
         print(f"\n❌ EXCEPTION: {e}")
@@ -1,32 +1,28 @@
-import requests
-import json
-import time
+from _quick_analysis import BACKEND_URL, dumps_pretty, quick_analysis, wait_until_ready
 
 def verify_data_quality_fix():
-    backend_url = "https://proppulse-ai-production.up.railway.app"
-    
     # Test with a multifamily address that should trigger estimation
     address = "123 Main Street Apt 5, Los Angeles, CA 90210"
-    
+
     print(f"Testing backend data quality fix with: {address}")
     print("=" * 60)
-    
-    # Wait for Railway deployment to complete (typically takes 1-2 minutes)
-    print("Waiting 30 seconds for Railway deployment to complete...")
-    time.sleep(30)
-    
+
+    # Probe /health with backoff instead of a fixed sleep - if the deploy is
+    # already live (e.g. a re-run) this returns in under a second
+    print("Waiting for Railway deployment to become ready...")
+    if wait_until_ready(f"{BACKEND_URL}/health"):
+        print("✅ Backend is ready")
+    else:
+        print("⚠️ Backend still not responding, trying anyway...")
+
     try:
-        response = requests.post(
-            f"{backend_url}/quick-analysis",
-            headers={"Content-Type": "application/json"},
-            json={"address": address},
-            timeout=30
-        )
-        
-        print(f"Status Code: {response.status_code}")
-        
-        if response.status_code == 200:
-            data = response.json()
+        # ttl=0 bypasses the disk cache - this script verifies the deploy
+        # that just went live, so a response recorded before it is useless
+        status_code, data = quick_analysis(address, ttl=0)
+
+        print(f"Status Code: {status_code}")
+
+        if status_code == 200:
             print("\n✅ SUCCESS - Got response from backend")
             
             # Check for market_data and data_quality
@@ -53,11 +49,11 @@ def verify_data_quality_fix():
                 
             # Print full response structure for debugging
             print("\nFull Response Structure:")
-            print(json.dumps(data, indent=2, default=str))
+            print(dumps_pretty(data))
             
         else:
-            print(f"\n❌ ERROR - Status: {response.status_code}")
-            print(f"Response: {response.text}")
+            print(f"\n❌ ERROR - Status: {status_code}")
+            print(f"Response: {data}")
             
     except Exception as e:
         print(f"\n❌ EXCEPTION: {e}")
@@ -1,6 +1,13 @@
-import time
+import os
+import sys
 import webbrowser
 
+from _quick_analysis import SESSION, wait_until_ready
+
+# Browser + manual checks only make sense on a dev laptop; under CI or a
+# redirected stdout fall back to a plain HTTP assertion
+INTERACTIVE = sys.stdout.isatty() and os.environ.get("CI") != "true"
+
 def verify_frontend_fix():
     """Final verification of the frontend fix for the data quality badge"""
     
@@ -16,22 +23,34 @@ def verify_frontend_fix():
     print("✅ Backend is correctly returning data_quality information")
     print("✅ Frontend was updated to use snake_case field names (is_estimated_data)")
     print()
-    print("⏳ Waiting for Vercel deployment to complete (60 seconds)...")
-    time.sleep(60)  # Give Vercel time to deploy
-    
-    print("\n🚀 Opening frontend in browser for manual verification")
-    print("Please check for:")
-    print("1. Data quality badge showing 'Estimated Data'")
-    print("2. Property details populated with estimated values")
-    print()
-    print("Instructions for manual verification:")
-    print("1. Look for amber/yellow badge at top of Property Overview card")
-    print("2. Confirm it shows 'Estimated Data' text")
-    print("3. Confirm property details show realistic estimated values")
-    
-    # Open the URL in the default browser
-    webbrowser.open(test_url)
-    
+    # Probe the deployed URL with backoff instead of a fixed 60s sleep - an
+    # already-live deploy is detected on the first probe
+    print("⏳ Waiting for Vercel deployment to become ready...")
+    if wait_until_ready(test_url):
+        print("✅ Frontend is responding")
+    else:
+        print("⚠️ Frontend still not responding, opening anyway...")
+
+
+    if INTERACTIVE:
+        print("\n🚀 Opening frontend in browser for manual verification")
+        print("Please check for:")
+        print("1. Data quality badge showing 'Estimated Data'")
+        print("2. Property details populated with estimated values")
+        print()
+        print("Instructions for manual verification:")
+        print("1. Look for amber/yellow badge at top of Property Overview card")
+        print("2. Confirm it shows 'Estimated Data' text")
+        print("3. Confirm property details show realistic estimated values")
+
+        # Open the URL in the default browser
+        webbrowser.open(test_url)
+    else:
+        # Headless run: no browser, just assert the page is being served
+        response = SESSION.get(test_url, timeout=10)
+        assert response.status_code == 200, f"Frontend returned {response.status_code}"
+        print("\n✅ Frontend responded 200 (non-interactive check)")
+
     print("\n✅ VERIFICATION PROCESS COMPLETE")
     print("If you don't see the data quality badge or property estimates,")
     print("you may need to wait a bit longer for the deployment to complete.")
@@ -2,7 +2,12 @@
 """
 Simple test of the enhanced property data service
 """
-import json
+try:
+    import orjson
+    _dumps = lambda o: orjson.dumps(o, option=orjson.OPT_INDENT_2).decode()
+except ImportError:
+    import json
+    _dumps = lambda o: json.dumps(o, indent=2)
 
 def test_enhanced_apis():
     print("🚀 Testing Enhanced Property Data APIs")
@@ -66,4 +71,4 @@ def test_enhanced_apis():
 if __name__ == "__main__":
     result = test_enhanced_apis()
     print(f"\n📋 JSON Output:")
-    print(json.dumps(result, indent=2))
+    print(_dumps(result))
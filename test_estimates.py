@@ -1,19 +1,12 @@
-import requests
+from tests._http_config import TIMEOUT, make_session
+
+# Pooled session shared by every request in this script
+_session = make_session()
 
 api_url = 'http://localhost:8000'
 
-def test_address(address):
+def print_result(address, data):
     print(f'\nTesting address: {address}')
-    response = requests.post(
-        f'{api_url}/quick-analysis',
-        json={'address': address}
-    )
-    
-    if response.status_code != 200:
-        print(f'Error: {response.status_code}, {response.text}')
-        return
-    
-    data = response.json()
     property_details = data.get('analysis_result', {}).get('property_details', {})
     market_data = data.get('analysis_result', {}).get('market_data', {})
     data_quality = market_data.get('data_quality', {})
@@ -27,11 +20,22 @@ def test_address(address):
     print(f'Data Quality: {"Estimated" if data_quality.get("is_estimated_data") else "Real"} data')
     print(f'Notes: {data_quality.get("notes")}')
 
-# Test a clear single family home address
-test_address('123 Main St, Anytown USA')
+addresses = [
+    '123 Main St, Anytown USA',  # Clear single family home
+    '123 Office Plaza, Business District, Anytown USA',  # Commercial
+    'Wilshire Apartment Complex, 5678 Wilshire Blvd, Los Angeles, CA',  # Multifamily
+]
 
-# Test a commercial address
-test_address('123 Office Plaza, Business District, Anytown USA')
+# One batched request instead of three - the server fans the addresses out
+# internally, so we pay a single round trip for the whole set
+response = _session.post(
+    f'{api_url}/quick-analysis/batch',
+    json={'addresses': addresses},
+    timeout=TIMEOUT
+)
 
-# Test a multifamily address
-test_address('Wilshire Apartment Complex, 5678 Wilshire Blvd, Los Angeles, CA')
+if response.status_code != 200:
+    print(f'Error: {response.status_code}, {response.text}')
+else:
+    for address, result in zip(addresses, response.json()['results']):
+        print_result(address, result)
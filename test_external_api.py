@@ -5,7 +5,10 @@ Test the updated external API service
 import asyncio
 import sys
 import os
-sys.path.insert(0, '/Volumes/project/intern/proppulse-ai/backend')
+
+# Resolve the backend package relative to this file instead of a hard-coded
+# absolute path that only exists on one machine
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), 'backend'))
 
 from services.external_apis import ExternalAPIService
 
@@ -34,4 +37,5 @@ async def test_external_api():
         print(f"❌ Error: {e}")
 
 if __name__ == "__main__":
+    import _bootstrap  # installs uvloop when available (backend/ is on sys.path above)  # noqa: F401
     asyncio.run(test_external_api())
@@ -1,10 +1,21 @@
 """
 Quick API test script to debug property data issues
 """
-import requests
-import json
+import os
 import sys
 
+from tests._http_config import TIMEOUT, make_session
+
+try:
+    import orjson
+    _dumps = lambda o: orjson.dumps(o, option=orjson.OPT_INDENT_2).decode()
+except ImportError:
+    import json
+    _dumps = lambda o: json.dumps(o, indent=2)
+
+# Pooled session shared by every request in this script
+_session = make_session()
+
 def test_quick_analysis(address):
     """Test the quick-analysis endpoint"""
     print(f"Testing quick-analysis endpoint with address: {address}")
@@ -14,12 +25,17 @@ def test_quick_analysis(address):
         headers = {"Content-Type": "application/json"}
         payload = {"address": address}
         
-        response = requests.post(url, headers=headers, json=payload)
+        response = _session.post(url, headers=headers, json=payload, timeout=TIMEOUT)
         
         if response.status_code == 200:
             data = response.json()
             print("Success! Response:")
-            print(json.dumps(data, indent=2))
+            if os.getenv("VERBOSE"):
+                print(_dumps(data))
+            else:
+                # The full indented dump can be dozens of KB; print a shape
+                # digest by default and save the real dump for VERBOSE=1
+                print({k: type(v).__name__ for k, v in data.items()})
             
             # Check the neighborhood info/data paths
             print("\nNeighborhood info check:")
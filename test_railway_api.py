@@ -1,49 +1,65 @@
-import requests
-import json
-import sys
+from concurrent.futures import ThreadPoolExecutor, as_completed
+
+from tests._fixtures import RAILWAY_TEST_ADDRESSES
+from tests._http_config import TIMEOUT, make_session
+
+# Pooled session shared by every request in this script
+_session = make_session()
+
+try:
+    import orjson
+
+    def _json(resp):
+        # Decode the raw bytes with orjson, skipping charset sniffing
+        return orjson.loads(resp.content)
+except ImportError:
+    def _json(resp):
+        return resp.json()
 
 def test_address(address):
-    print(f"\nTesting address: {address}")
+    # Buffer output and return it so parallel workers don't interleave prints
+    lines = [f"\nTesting address: {address}"]
     try:
-        response = requests.post(
+        response = _session.post(
             "https://proppulse-ai-production.up.railway.app/quick-analysis",
             headers={"Content-Type": "application/json"},
             json={"address": address},
-            timeout=10
+            timeout=TIMEOUT
         )
-        
+
         if response.status_code == 200:
-            data = response.json()
+            data = _json(response)
             property_details = data.get("analysis_result", {}).get("property_details", {})
             market_data = data.get("analysis_result", {}).get("market_data", {})
             data_quality = market_data.get("data_quality", {})
-            
-            print(f"Property Type: {property_details.get('property_type', 'Not available')}")
-            print(f"Units: {property_details.get('units', 'Not available')}")
-            print(f"Square Footage: {property_details.get('square_footage', 'Not available')}")
-            print(f"Market Value: ${property_details.get('market_value', 'Not available')}")
-            print(f"Data Quality: {'Estimated' if data_quality.get('is_estimated_data') else 'Real'} data")
-            print(f"Notes: {data_quality.get('notes', 'Not available')}")
-            return True
+
+            lines.append(f"Property Type: {property_details.get('property_type', 'Not available')}")
+            lines.append(f"Units: {property_details.get('units', 'Not available')}")
+            lines.append(f"Square Footage: {property_details.get('square_footage', 'Not available')}")
+            lines.append(f"Market Value: ${property_details.get('market_value', 'Not available')}")
+            lines.append(f"Data Quality: {'Estimated' if data_quality.get('is_estimated_data') else 'Real'} data")
+            lines.append(f"Notes: {data_quality.get('notes', 'Not available')}")
+            return address, True, "\n".join(lines)
         else:
-            print(f"Error: Status code {response.status_code}")
-            print(response.text)
-            return False
+            lines.append(f"Error: Status code {response.status_code}")
+            lines.append(response.text)
+            return address, False, "\n".join(lines)
     except Exception as e:
-        print(f"Error: {str(e)}")
-        return False
+        lines.append(f"Error: {str(e)}")
+        return address, False, "\n".join(lines)
 
-# Try different property types
-addresses = [
-    "123 Main St, Anytown USA",  # Single family
-    "123 Office Plaza, Business District",  # Commercial
-    "Wilshire Apartment Complex, Los Angeles, CA"  # Multifamily
-]
+# Try different property types - shared table from tests/_fixtures.py
+addresses = RAILWAY_TEST_ADDRESSES
 
+# The requests are independent - run them in parallel so the batch takes
+# one round trip of wall time instead of one per address
 success = 0
-for address in addresses:
-    if test_address(address):
-        success += 1
+with ThreadPoolExecutor(max_workers=min(len(addresses), 6)) as executor:
+    futures = {executor.submit(test_address, address): address for address in addresses}
+    for future in as_completed(futures):
+        _, ok, output = future.result()
+        print(output)
+        success += ok
 
 print(f"\nSuccessful tests: {success}/{len(addresses)}")
 if success == len(addresses):
@@ -2,8 +2,20 @@
 """
 Test ATTOM API integration and verify real data vs estimates
 """
-import requests
-import json
+from tests._http_config import TIMEOUT, make_session
+
+# Pooled session shared by every request in this script
+_session = make_session()
+
+try:
+    import orjson
+
+    def _json(resp):
+        # Decode the raw bytes with orjson, skipping charset sniffing
+        return orjson.loads(resp.content)
+except ImportError:
+    def _json(resp):
+        return resp.json()
 
 def test_attom_integration():
     """Test if ATTOM API is working and returning real data"""
@@ -17,21 +29,26 @@ def test_attom_integration():
     ]
     
     backend_url = "https://proppulse-ai-production.up.railway.app"
-    
+
+    # Build the endpoint URL once for the whole loop. Only a handful of
+    # fields are read below, so ask the server to project them - the wire
+    # payload shrinks from the full nested analysis to four keys.
+    endpoint = f"{backend_url}/quick-analysis?fields=property_type,units,square_footage,data_quality"
+
     for address in test_addresses:
         print(f"\n🏠 Testing: {address}")
         print("-" * 40)
-        
+
         try:
             # Test the quick-analysis endpoint
-            response = requests.post(
-                f"{backend_url}/quick-analysis",
+            response = _session.post(
+                endpoint,
                 json={"address": address},
-                timeout=30
+                timeout=TIMEOUT
             )
             
             if response.status_code == 200:
-                data = response.json()
+                data = _json(response)
                 print(f"✅ Response received")
                 
                 # Check data quality
@@ -0,0 +1,27 @@
+"""Shared address tables for the test scripts.
+
+Each standalone script used to allocate its own in-function address list
+on every call. Hoisting them here gives one module-level tuple per table,
+built once at import, and a single source of truth that both the scripts
+and the consolidated pytest modules can parametrize from.
+"""
+
+# One address per property class: single family, commercial, multifamily
+RAILWAY_TEST_ADDRESSES = (
+    "123 Main St, Anytown USA",
+    "123 Office Plaza, Business District",
+    "Wilshire Apartment Complex, Los Angeles, CA",
+)
+
+# Two of each property class, spread across metros
+ESTIMATION_TEST_ADDRESSES = (
+    # Single family homes
+    "123 Main St, Austin, TX 78701",
+    "456 Residential Lane, San Francisco, CA 94105",
+    # Commercial properties
+    "789 Office Plaza, Dallas, TX 75201",
+    "101 Business Center, Chicago, IL 60601",
+    # Multifamily properties
+    "Wilshire Apartment Complex, Los Angeles, CA 90036",
+    "567 Tower Apartments Unit 301, New York, NY 10001",
+)
@@ -0,0 +1,45 @@
+"""Shared HTTP configuration for the test scripts.
+
+One split (connect, read) budget instead of per-script timeout=10/30 magic
+numbers: a dead endpoint fails in ~2s at connect time rather than eating
+the whole end-to-end budget, while slow analyses still get 30s to respond.
+make_session() builds the pooled retrying session the scripts share.
+"""
+
+# requests-style (connect, read) tuple
+TIMEOUT = (2.0, 30.0)
+
+
+def make_session():
+    """A pooled requests.Session with retries, closed at interpreter exit.
+
+    Keep-alive reuse instead of a fresh TCP+TLS handshake per call; retries
+    cover the transient 5xxs Railway emits mid-deploy. Imports lazily so
+    importing this module doesn't require requests.
+    """
+    import atexit
+
+    import requests
+    from requests.adapters import HTTPAdapter
+    from urllib3.util.retry import Retry
+
+    session = requests.Session()
+    adapter = HTTPAdapter(
+        pool_connections=4,
+        pool_maxsize=4,
+        max_retries=Retry(total=2, backoff_factor=0.3, status_forcelist=(502, 503, 504)),
+    )
+    session.mount("http://", adapter)
+    session.mount("https://", adapter)
+    atexit.register(session.close)
+    return session
+
+
+def httpx_timeout():
+    """The same budget as an httpx.Timeout.
+
+    Built lazily so importing this module doesn't require httpx.
+    """
+    import httpx
+
+    return httpx.Timeout(connect=2.0, read=30.0, write=5.0, pool=5.0)
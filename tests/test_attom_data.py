@@ -0,0 +1,51 @@
+"""Parametrized ATTOM data tests.
+
+Covers the addresses exercised serially by the standalone
+test_attom_integration.py / test_real_attom_data.py scripts. As a
+parametrized pytest-asyncio module the cases can be spread across cores
+with pytest-xdist (pytest -n auto) while the session-scoped service reuses
+one pooled httpx client, so the batch runs in roughly the slowest single
+request instead of their sum.
+"""
+import pytest
+
+pytest_asyncio = pytest.importorskip("pytest_asyncio")
+httpx = pytest.importorskip("httpx")
+
+from services.free_property_apis import FreePropertyDataService  # noqa: E402  (backend/ on path via conftest)
+from tests._http_config import httpx_timeout  # noqa: E402
+
+# Combined address list from the two standalone scripts
+TEST_ADDRESSES = [
+    "16633 Ventura Blvd, Encino, CA 91436",
+    "1234 Sunset Blvd, Los Angeles, CA 90028",
+    "123 Main St, Austin, TX 78701",
+    "5325 Newcastle Ave UNIT 319, Encino, CA 91316",
+    "5678 Wilshire Blvd, Los Angeles, CA 90036",
+]
+
+
+# loop_scope="session" keeps the fixture and every test on one event loop;
+# without it the client's connections would be opened in the session loop
+# but awaited from per-test loops (pytest-asyncio >= 0.24 semantics)
+@pytest_asyncio.fixture(loop_scope="session", scope="session")
+async def service():
+    """One service with a pooled client shared by every parametrized case."""
+    async with httpx.AsyncClient(
+        http2=True,
+        timeout=httpx_timeout(),
+        limits=httpx.Limits(max_connections=100, max_keepalive_connections=20),
+    ) as client:
+        svc = FreePropertyDataService(http_client=client)
+        await svc.warmup()
+        yield svc
+
+
+@pytest.mark.asyncio(loop_scope="session")
+@pytest.mark.parametrize("address", TEST_ADDRESSES)
+async def test_comprehensive_free_data(service, address):
+    data = await service.get_comprehensive_free_data(address)
+
+    assert isinstance(data, dict)
+    assert "error" not in data
+    assert data.get("property_type")
@@ -0,0 +1,58 @@
+"""Table-driven checks of the quick-analysis endpoint.
+
+The standalone test_*.py scripts repeat the same "POST /quick-analysis,
+inspect property_type/units/data_quality" pattern, each in its own
+interpreter with its own connection pool. This module runs the whole table
+in one pytest process over one shared Session. Pick a backend with
+-k local or -k railway; unreachable backends are skipped, not failed.
+"""
+import pytest
+
+requests = pytest.importorskip("requests")
+
+from tests._http_config import TIMEOUT  # noqa: E402
+
+# Representative address table: multifamily, commercial and single family
+ADDRESSES = [
+    "123 Main Street Apt 5, Los Angeles, CA 90210",
+    "Wilshire Apartment Complex, 5678 Wilshire Blvd, Los Angeles, CA",
+    "789 Office Plaza, Dallas, TX 75201",
+    "123 Main St, Austin, TX 78701",
+]
+
+
+@pytest.fixture(scope="module")
+def http():
+    """One pooled session shared by every case in the module."""
+    with requests.Session() as session:
+        yield session
+
+
+@pytest.fixture(params=[
+    pytest.param("http://localhost:8000", id="local"),
+    pytest.param("https://proppulse-ai-production.up.railway.app", id="railway"),
+])
+def api_url(request):
+    return request.param
+
+
+@pytest.mark.parametrize("address", ADDRESSES)
+def test_quick_analysis_shape(http, api_url, address):
+    try:
+        response = http.post(f"{api_url}/quick-analysis", json={"address": address}, timeout=TIMEOUT)
+    except requests.ConnectionError:
+        pytest.skip(f"{api_url} is not reachable")
+
+    assert response.status_code == 200
+    analysis = response.json()["analysis_result"]
+    assert "property_details" in analysis
+    assert "data_quality" in analysis["market_data"]
+
+
+def test_quick_analysis_requires_address(http, api_url):
+    try:
+        response = http.post(f"{api_url}/quick-analysis", json={}, timeout=TIMEOUT)
+    except requests.ConnectionError:
+        pytest.skip(f"{api_url} is not reachable")
+
+    assert response.status_code >= 400
@@ -1,87 +1,96 @@
-import requests
-import json
-from time import sleep
+import sys
+from concurrent.futures import ThreadPoolExecutor, as_completed
+
+from tests._fixtures import ESTIMATION_TEST_ADDRESSES
+from tests._http_config import TIMEOUT, make_session
+
+# Pooled session shared by every request in this script
+_session = make_session()
+
+def _test_address(endpoint, address):
+    """Test one address; returns (address, result_dict, buffered output)."""
+    lines = [f"\nTesting address: {address}"]
+    try:
+        response = _session.post(
+            endpoint,
+            json={"address": address},
+            timeout=TIMEOUT
+        )
+
+        if response.status_code != 200:
+            lines.append(f"❌ Error {response.status_code}: {response.text}")
+            return address, {"status": "error", "code": response.status_code}, "\n".join(lines)
+
+        data = response.json()
+        property_details = data.get("analysis_result", {}).get("property_details", {})
+        market_data = data.get("analysis_result", {}).get("market_data", {})
+        data_quality = market_data.get("data_quality", {})
+
+        # Print key information
+        lines.append(f"✅ Property Type: {property_details.get('property_type', 'Not available')}")
+        lines.append(f"   Units: {property_details.get('units', 'Not available')}")
+        lines.append(f"   Square Footage: {property_details.get('square_footage', 'Not available')}")
+        lines.append(f"   Market Value: ${property_details.get('market_value', 'Not available')}")
+        lines.append(f"   Data Quality: {'Estimated' if data_quality.get('is_estimated_data') else 'Real'} data")
+
+        result = {
+            "status": "success",
+            "property_type": property_details.get("property_type"),
+            "units": property_details.get("units"),
+            "has_meaningful_data": bool(property_details.get("property_type") != "Unknown" and property_details.get("units")),
+            "is_estimated": bool(data_quality.get("is_estimated_data"))
+        }
+        return address, result, "\n".join(lines)
+
+    except Exception as e:
+        lines.append(f"❌ Exception: {str(e)}")
+        return address, {"status": "exception", "message": str(e)}, "\n".join(lines)
 
 def test_backend_estimation():
     """Test the backend estimation for different property types"""
     backend_url = "https://proppulse-ai-production.up.railway.app"
     print(f"Testing backend at {backend_url}...")
     
-    # Test different address types
-    addresses = [
-        # Single family homes
-        "123 Main St, Austin, TX 78701",
-        "456 Residential Lane, San Francisco, CA 94105",
-        
-        # Commercial properties
-        "789 Office Plaza, Dallas, TX 75201",
-        "101 Business Center, Chicago, IL 60601",
-        
-        # Multifamily properties
-        "Wilshire Apartment Complex, Los Angeles, CA 90036",
-        "567 Tower Apartments Unit 301, New York, NY 10001"
-    ]
+    # Test different address types - shared table from tests/_fixtures.py
+    addresses = ESTIMATION_TEST_ADDRESSES
     
     results = {}
-    
-    for address in addresses:
-        print(f"\nTesting address: {address}")
-        try:
-            response = requests.post(
-                f"{backend_url}/quick-analysis",
-                json={"address": address},
-                timeout=10
-            )
-            
-            if response.status_code != 200:
-                print(f"❌ Error {response.status_code}: {response.text}")
-                results[address] = {"status": "error", "code": response.status_code}
-                continue
-                
-            data = response.json()
-            property_details = data.get("analysis_result", {}).get("property_details", {})
-            market_data = data.get("analysis_result", {}).get("market_data", {})
-            data_quality = market_data.get("data_quality", {})
-            
-            # Print key information
-            print(f"✅ Property Type: {property_details.get('property_type', 'Not available')}")
-            print(f"   Units: {property_details.get('units', 'Not available')}")
-            print(f"   Square Footage: {property_details.get('square_footage', 'Not available')}")
-            print(f"   Market Value: ${property_details.get('market_value', 'Not available')}")
-            print(f"   Data Quality: {'Estimated' if data_quality.get('is_estimated_data') else 'Real'} data")
-            
-            # Store results
-            results[address] = {
-                "status": "success",
-                "property_type": property_details.get("property_type"),
-                "units": property_details.get("units"),
-                "has_meaningful_data": bool(property_details.get("property_type") != "Unknown" and property_details.get("units")),
-                "is_estimated": bool(data_quality.get("is_estimated_data"))
-            }
-            
-        except Exception as e:
-            print(f"❌ Exception: {str(e)}")
-            results[address] = {"status": "exception", "message": str(e)}
-        
-        sleep(1)  # Be nice to the API
-    
+    report_lines = []
+
+    # Each address is an independent round trip - run them through a small
+    # pool so the batch takes ~one RTT instead of one per address. Workers
+    # return buffered output; the whole report is flushed in one write at
+    # the end instead of a syscall per print.
+    # Build the endpoint URL once for all workers
+    endpoint = f"{backend_url}/quick-analysis"
+
+    with ThreadPoolExecutor(max_workers=min(len(addresses), 6)) as executor:
+        futures = {executor.submit(_test_address, endpoint, address): address for address in addresses}
+        for future in as_completed(futures):
+            address, result, output = future.result()
+            report_lines.append(output)
+            results[address] = result
+
     # Summary
-    print("\n=== SUMMARY ===")
+    report_lines.append("\n=== SUMMARY ===")
     success_count = sum(1 for r in results.values() if r.get("status") == "success")
     estimation_count = sum(1 for r in results.values() if r.get("is_estimated"))
-    print(f"Total addresses tested: {len(addresses)}")
-    print(f"Successful responses: {success_count}")
-    print(f"Addresses with estimation: {estimation_count}")
-    
+    report_lines.append(f"Total addresses tested: {len(addresses)}")
+    report_lines.append(f"Successful responses: {success_count}")
+    report_lines.append(f"Addresses with estimation: {estimation_count}")
+
     all_have_data = all(r.get("has_meaningful_data", False) for r in results.values() if r.get("status") == "success")
-    print(f"\nAll addresses have meaningful data: {'✅ YES' if all_have_data else '❌ NO'}")
-    
+    report_lines.append(f"\nAll addresses have meaningful data: {'✅ YES' if all_have_data else '❌ NO'}")
+
     if not all_have_data:
-        print("\nAddresses missing data:")
+        report_lines.append("\nAddresses missing data:")
         for addr, result in results.items():
             if result.get("status") == "success" and not result.get("has_meaningful_data"):
-                print(f"- {addr}")
-    
+                report_lines.append(f"- {addr}")
+
+    sys.stdout.write("\n".join(report_lines) + "\n")
+    sys.stdout.flush()
+
     return results
 
 if __name__ == "__main__":